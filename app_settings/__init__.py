@@ -1,3 +1,3 @@
-from app_settings.utils import LogLevel, SqlType
+from app_settings.utils import LogLevel, SqlType, get_dialect
 from app_settings.models import get_app_settings, AppSettings
-__all__ = ["get_app_settings", "LogLevel", "AppSettings", "SqlType"]
+__all__ = ["get_app_settings", "LogLevel", "AppSettings", "SqlType", "get_dialect"]
@@ -1,9 +1,12 @@
+import os
+import json
+
 from pathlib import Path
-from functools import lru_cache
-from pydantic import BaseModel, model_validator, PrivateAttr
+from functools import lru_cache, cached_property
+from pydantic import BaseModel, ConfigDict, Field, model_validator, PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from .utils import LogLevel, Environment, SqlType, CONNECTION_TEMPLATES, generate_run_guid, SqlGlotDialectRegistry
+from .utils import LogLevel, Environment, SqlType, DSN_BUILDERS, generate_run_guid, SqlGlotDialectRegistry
 
 
 class DBCredentials(BaseModel):
@@ -16,9 +19,15 @@ class DBCredentials(BaseModel):
     user: str
     password: str
 
-    def __str__(self) -> str:
+    model_config = ConfigDict(frozen=True, ignored_types=(cached_property,))
+
+    @cached_property
+    def _joined(self) -> str:
         return f"{self.user}:{self.password}"
 
+    def __str__(self) -> str:
+        return self._joined
+
 
 class DbSettings(BaseModel):
     """
@@ -38,46 +47,42 @@ class DbSettings(BaseModel):
     credentials: DBCredentials
     driver: str | None = None  # optional driver for some DBs
 
-    @property
+    # settings are fixed for the run, so derived values can be cached on the instance
+    model_config = ConfigDict(frozen=True, ignored_types=(cached_property,))
+
+    @cached_property
     def connection_string(self) -> str:
         """
         Generates the database connection string based on the settings.
+        Computed once per instance and cached.
         Returns:
             str: Formatted connection string.
         """
-        if self.db_type == SqlType.SQLITE:
-            template = CONNECTION_TEMPLATES["sqlite"]
-            return template.format(
-                path_to_file=self.database
-            )
-        elif self.db_type == SqlType.SQLSERVER:
-            if self.port:
-                template = CONNECTION_TEMPLATES["mssql"]["port"]
-                return template.format(
-                    credentials=str(self.credentials),
-                    host=self.host,
-                    port=self.port if self.port else "",
-                    database=self.database,
-                    driver=self.driver if self.driver else "ODBC+Driver+17+for+SQL+Server"
-                )
-            else:
-                template = CONNECTION_TEMPLATES["mssql"]["no_port"]
-                return template.format(
-                    credentials=str(self.credentials),
-                    host=self.host,
-                    database=self.database,
-                    driver=self.driver if self.driver else "ODBC+Driver+17+for+SQL+Server"
-                )
-        else:
-            template = CONNECTION_TEMPLATES.get(self.db_type.value)
-            if template is None:
-                raise ValueError(f"Unsupported database type: {self.db_type}")
-            return template.format(
-                credentials=str(self.credentials),
-                host=self.host,
-                port=self.port if self.port else "",
-                database=self.database
-            )
+        builder = DSN_BUILDERS.get(self.db_type)
+        if builder is None:
+            raise ValueError(f"Unsupported database type: {self.db_type}")
+        return builder(self)
+
+
+def _construct_db_settings(item: dict) -> DbSettings:
+    """
+    Build DbSettings from a trusted raw dict without running Pydantic validation.
+    Args:
+        item (dict): Raw source database entry as loaded from JSON.
+    Returns:
+        DbSettings: Unvalidated DbSettings instance.
+    """
+    fields = {k: v for k, v in item.items() if k != "credentials"}
+    # enum lookup is still needed to pick the DSN builder
+    fields["db_type"] = SqlType(fields["db_type"])
+    return DbSettings.model_construct(
+        credentials=DBCredentials.model_construct(**item["credentials"]),
+        **fields
+    )
+
+
+# log directories already created by this process
+_CREATED_LOG_DIRS: set[Path] = set()
 
 
 class LogSettings(BaseModel):
@@ -95,20 +100,71 @@ class LogSettings(BaseModel):
     json_log: bool = True
     _run_guid: str = PrivateAttr(default_factory=generate_run_guid)
 
+    model_config = ConfigDict(frozen=True)
+
     def __init__(self, **data):
         super().__init__(**data)
-        # create log directory if it doesn't exist
-        self.log_directory.mkdir(parents=True, exist_ok=True)
+        # create log directory if it doesn't exist; skip the syscall for ones already made
+        if self.log_directory not in _CREATED_LOG_DIRS:
+            self.log_directory.mkdir(parents=True, exist_ok=True)
+            _CREATED_LOG_DIRS.add(self.log_directory)
 
     @property
     def run_guid(self) -> str:
         return self._run_guid
 
 
+class PoolSettings(BaseModel):
+    """SQLAlchemy connection pool settings shared by database engines.
+    Attributes:
+        pool_size (int): Number of connections kept open in the pool.
+        max_overflow (int): Extra connections allowed beyond pool_size under load.
+        pool_pre_ping (bool): Test connections on checkout and replace stale ones.
+        pool_recycle (int): Seconds after which a connection is recycled.
+        pool_use_lifo (bool): Reuse the most recently returned connection first.
+    """
+    pool_size: int = 10
+    max_overflow: int = 20
+    pool_pre_ping: bool = True
+    pool_recycle: int = 1800
+    pool_use_lifo: bool = True
+
+    model_config = ConfigDict(frozen=True)
+
+    def engine_options(self, connection_string: str) -> dict:
+        """
+        create_engine pool arguments for a connection string.
+        pool_size, max_overflow and pool_use_lifo only apply to QueuePool; dialects that
+        pick another pool (e.g. SingletonThreadPool for in-memory SQLite) reject them.
+        Args:
+            connection_string (str): Database URL the engine will be created for.
+        Returns:
+            dict: Keyword arguments for create_engine.
+        """
+        # sqlalchemy is only needed once an engine is built
+        from sqlalchemy.engine import make_url
+        from sqlalchemy.pool import QueuePool
+
+        options = {
+            "pool_pre_ping": self.pool_pre_ping,
+            "pool_recycle": self.pool_recycle,
+        }
+        url = make_url(connection_string)
+        if issubclass(url.get_dialect().get_pool_class(url), QueuePool):
+            options.update(
+                pool_size=self.pool_size,
+                max_overflow=self.max_overflow,
+                pool_use_lifo=self.pool_use_lifo,
+            )
+        return options
+
+
 class FeatureFlags(BaseModel):
     """Feature flags for enabling/disabling features."""
     enable_llm_integration: bool = False
 
+    model_config = ConfigDict(frozen=True)
+
 
 class AppSettings(BaseSettings):
     """Application settings for db-dox ETL process.
@@ -116,8 +172,11 @@ class AppSettings(BaseSettings):
         app_name (str): Name of the application.
         dox_db (DbSettings | None): Settings for the documentation database.
         source_dbs_file (str | None): Path to JSON file with source database settings.
+        trust_source_dbs_file (bool): Skip validation when loading source_dbs_file.
         source_dbs (list[DbSettings]): List of source database settings.
         log (LogSettings): Logging configuration settings.
+        pool (PoolSettings): Connection pool settings for database engines.
+        stream_chunk_size (int): Rows fetched per round trip when streaming source queries.
         feature_flags (FeatureFlags): Feature flags for enabling/disabling features.
         environment (Environment): Application environment (development, staging, production).
 
@@ -125,13 +184,17 @@ class AppSettings(BaseSettings):
     app_name: str = "db-dox ETL"
     dox_db: DbSettings | None = None
     source_dbs_file: str | None = None
+    trust_source_dbs_file: bool = False
     source_dbs: list[DbSettings] = []
-    log: LogSettings = LogSettings()
-    feature_flags: FeatureFlags = FeatureFlags()
+    log: LogSettings = Field(default_factory=LogSettings)
+    pool: PoolSettings = Field(default_factory=PoolSettings)
+    stream_chunk_size: int = 5_000
+    feature_flags: FeatureFlags = Field(default_factory=FeatureFlags)
     environment: Environment = Environment.DEVELOPMENT
-    _sql_glot_dialect_registry: SqlGlotDialectRegistry = PrivateAttr(
-        default_factory=SqlGlotDialectRegistry
+    _sql_glot_dialect_registry: SqlGlotDialectRegistry | None = PrivateAttr(
+        default=None
     )
+    _by_name_index: dict[str, DbSettings] = PrivateAttr(default_factory=dict)
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -146,18 +209,22 @@ class AppSettings(BaseSettings):
         If source_dbs_file is set, load JSON and parse as list[DbSettings].
         """
         if self.source_dbs_file:
-            import json
-            from pathlib import Path
-
             path = Path(self.source_dbs_file)
-            if not path.exists():
+            try:
+                data = path.read_bytes()
+            except FileNotFoundError:
                 raise FileNotFoundError(
                     f"Source DB settings file not found: {path}"
-                )
+                ) from None
 
-            raw = json.loads(path.read_text())
-            # trigger Pydantic validation
-            self.source_dbs = [DbSettings.model_validate(item) for item in raw]
+            raw = json.loads(data)
+            if self.trust_source_dbs_file:
+                # trust boundary: only set trust_source_dbs_file for internally managed
+                # files; entries are constructed without validation or type coercion
+                self.source_dbs = [_construct_db_settings(item) for item in raw]
+            else:
+                # trigger Pydantic validation
+                self.source_dbs = [DbSettings.model_validate(item) for item in raw]
 
         return self
 
@@ -168,13 +235,17 @@ class AppSettings(BaseSettings):
         Returns:
             DbSettings | None: Matching DbSettings instance or None if not found.
         """
-        for db_settings in self.source_dbs:
-            if db_settings.database == name:
-                return db_settings
-        return None
+        if not self._by_name_index:
+            # built on first lookup; keep the first entry for duplicate names
+            for db_settings in self.source_dbs:
+                self._by_name_index.setdefault(db_settings.database, db_settings)
+        return self._by_name_index.get(name)
 
     @property
     def sql_glot_dialect_registry(self) -> SqlGlotDialectRegistry:
+        # built on first use so settings construction doesn't pull in sqlglot
+        if self._sql_glot_dialect_registry is None:
+            self._sql_glot_dialect_registry = SqlGlotDialectRegistry()
         return self._sql_glot_dialect_registry
 
 
@@ -187,6 +258,11 @@ def get_app_settings() -> AppSettings:
     return AppSettings()
 
 
+# warm the settings cache at import so concurrent workers never hit the first-call load
+if os.environ.get("EAGER_SETTINGS") == "1":
+    get_app_settings()
+
+
 if __name__ == "__main__":
     # print(app_settings)
     from dotenv import dotenv_values
@@ -1,9 +1,14 @@
-from dataclasses import dataclass, field
-from enum import Enum
+from dataclasses import dataclass
+from enum import StrEnum
 from uuid import uuid4
 from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable
 
-import sqlglot
+if TYPE_CHECKING:
+    import sqlglot
+
+    from .models import DbSettings
 
 
 @lru_cache
@@ -15,13 +20,13 @@ def generate_run_guid() -> str:
     return str(uuid4())
 
 
-class Environment(Enum):
+class Environment(StrEnum):
     DEVELOPMENT = "development"
     TESTING = "testing"
     PRODUCTION = "production"
 
 
-class LogLevel(Enum):
+class LogLevel(StrEnum):
     TRACE = "trace"
     DEBUG = "debug"
     INFO = "info"
@@ -30,7 +35,7 @@ class LogLevel(Enum):
     CRITICAL = "critical"
 
 
-class SqlType(Enum):
+class SqlType(StrEnum):
     POSTGRESQL = "postgresql"
     MYSQL = "mysql"
     MYSQL_PYMYSQL = "mysql+pymysql"
@@ -39,64 +44,124 @@ class SqlType(Enum):
     SQLITE = "sqlite"
 
 
-CONNECTION_TEMPLATES = {
-    "postgresql": "postgresql+psycopg://{credentials}@{host}:{port}/{database}",
-    "mysql": "mysql+mysqldb://{credentials}@{host}:{port}/{database}",
-    "mysql+pymysql": "mysql+pymysql://{credentials}@{host}:{port}/{database}",
-    "mssql":
-        {
-            "port": (
-                "mssql+pyodbc://{credentials}@{host}:{port}/{database}"
-                "?driver={driver}&TrustServerCertificate=yes&Encrypt=no"
-            ),
-            "no_port": (
-                "mssql+pyodbc://{credentials}@{host}/{database}"
-                "?driver={driver}&TrustServerCertificate=yes&Encrypt=no"
-            )
-        },
-    "sqlite": "sqlite:///{path_to_file}"
+# sqlalchemy driver scheme for each server-style database type
+DRIVER_SCHEMES = {
+    "postgresql": "postgresql+psycopg",
+    "mysql": "mysql+mysqldb",
+    "mysql+pymysql": "mysql+pymysql",
+    "mssql": "mssql+pyodbc",
 }
 
+MSSQL_DEFAULT_DRIVER = "ODBC+Driver+17+for+SQL+Server"
 
-@dataclass(frozen=True)
-class SqlGlotDialectRegistry:
-    mapping: dict[SqlType, type[sqlglot.Dialect]] = field(
-        default_factory=dict, init=False
+
+def sqlite_dsn(path_to_file: str) -> str:
+    """Build a sqlite connection string for the given database file."""
+    return f"sqlite:///{path_to_file}"
+
+
+def _address(host: str, port: int | None) -> str:
+    return host if port is None else f"{host}:{port}"
+
+
+def server_dsn(scheme: str, credentials: str, host: str, port: int | None, database: str) -> str:
+    """Build a connection string for a host/port style database server, omitting the port when not set."""
+    return f"{scheme}://{credentials}@{_address(host, port)}/{database}"
+
+
+def mssql_dsn(credentials: str, host: str, port: int | None, database: str, driver: str) -> str:
+    """Build a pyodbc SQL Server connection string, omitting the port when not set."""
+    return (
+        f"mssql+pyodbc://{credentials}@{_address(host, port)}/{database}"
+        f"?driver={driver}&TrustServerCertificate=yes&Encrypt=no"
     )
 
-    def __post_init__(self) -> None:
-        m: dict[SqlType, type[sqlglot.Dialect]] = {}
 
-        for sql_type in SqlType:
-            dialect_class = self._derive_dialect_from_sql_type(sql_type)
-            if dialect_class is None:
-                raise ValueError(
-                    f"Corresponding sqlglot dialect class not found for sql type {sql_type!r}"
-                )
-            m[sql_type] = dialect_class
+def _make_server_builder(scheme: str) -> Callable[["DbSettings"], str]:
+    def _builder(settings: "DbSettings") -> str:
+        return server_dsn(
+            scheme, str(settings.credentials), settings.host, settings.port, settings.database
+        )
+    return _builder
+
 
-    def _derive_dialect_from_sql_type(self, sql_type: SqlType) -> type[sqlglot.Dialect] | None:
-        type_name = sql_type.value
+def _build_mssql_dsn(settings: "DbSettings") -> str:
+    return mssql_dsn(
+        str(settings.credentials),
+        settings.host,
+        settings.port,
+        settings.database,
+        settings.driver if settings.driver else MSSQL_DEFAULT_DRIVER
+    )
+
+
+# one builder per database type, each specialized to the DSN shape it produces
+DSN_BUILDERS: dict[SqlType, Callable[["DbSettings"], str]] = {
+    SqlType.POSTGRESQL: _make_server_builder(DRIVER_SCHEMES[SqlType.POSTGRESQL]),
+    SqlType.MYSQL: _make_server_builder(DRIVER_SCHEMES[SqlType.MYSQL]),
+    SqlType.MYSQL_PYMYSQL: _make_server_builder(DRIVER_SCHEMES[SqlType.MYSQL_PYMYSQL]),
+    SqlType.SQLSERVER: _build_mssql_dsn,
+    SqlType.SQLITE: lambda settings: sqlite_dsn(settings.database),
+}
 
-        dialect_class: type[sqlglot.Dialect] | None = None
 
-        if type_name == 'mssql':
-            dialect_class = sqlglot.Dialect.get('tsql')
+def _derive_dialect_from_sql_type(sql_type: SqlType) -> "type[sqlglot.Dialect] | None":
+    # sqlglot is heavy; import on first dialect lookup rather than with app_settings
+    import sqlglot
 
-        elif "+" in type_name:
-            dialect_class = sqlglot.Dialect.get(type_name.split('+')[0])
+    type_name = sql_type
 
-        elif "postgres" in type_name:
-            dialect_class = sqlglot.Dialect.get('postgres')
+    dialect_class: type[sqlglot.Dialect] | None = None
 
-        else:
-            dialect_class = sqlglot.Dialect.get(type_name)
+    if type_name == 'mssql':
+        dialect_class = sqlglot.Dialect.get('tsql')
+
+    elif "+" in type_name:
+        dialect_class = sqlglot.Dialect.get(type_name.split('+')[0])
+
+    elif "postgres" in type_name:
+        dialect_class = sqlglot.Dialect.get('postgres')
+
+    else:
+        dialect_class = sqlglot.Dialect.get(type_name)
+
+    return dialect_class
+
+
+@lru_cache(maxsize=None)
+def _dialects() -> "MappingProxyType[SqlType, sqlglot.Dialect]":
+    """Build the process-wide, read-only SqlType -> sqlglot dialect table on first use."""
+    m: dict[SqlType, "sqlglot.Dialect"] = {}
+
+    for sql_type in SqlType:
+        dialect_class = _derive_dialect_from_sql_type(sql_type)
+        if dialect_class is None:
+            raise ValueError(
+                f"Corresponding sqlglot dialect class not found for sql type {sql_type!r}"
+            )
+        # dialects are stateless, so one shared instance per type is enough
+        m[sql_type] = dialect_class()
+
+    return MappingProxyType(m)
+
+
+@lru_cache(maxsize=None)
+def get_dialect(sql_type: SqlType) -> "sqlglot.Dialect":
+    """Return the shared sqlglot dialect object for the given SQL type."""
+    try:
+        return _dialects()[sql_type]
+    except KeyError:
+        raise ValueError(f"No sqlglot dialect registered for {sql_type!r}")
+
+
+@dataclass(frozen=True)
+class SqlGlotDialectRegistry:
+    """Thin view over the shared dialect table kept for existing callers."""
 
-        return dialect_class
+    @property
+    def mapping(self) -> "MappingProxyType[SqlType, sqlglot.Dialect]":
+        return _dialects()
 
-    def get(self, sql_type: SqlType) -> sqlglot.Dialect:
-        """Return the sqlglot dialect object for the given SQL type."""
-        try:
-            return self.mapping[sql_type]()
-        except KeyError:
-            raise ValueError(f"No sqlglot dialect registered for {sql_type!r}")
+    def get(self, sql_type: SqlType) -> "sqlglot.Dialect":
+        """Return the shared sqlglot dialect object for the given SQL type."""
+        return get_dialect(sql_type)
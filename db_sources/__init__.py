@@ -1,5 +1,8 @@
+from typing import Any
+
 from .source_db import SourceDatabase
-from .query_model import DIM_COLUMNS, DIM_OBJECTS, FACT_RELATIONSHIPS, Queries
+from .query_model import Queries
+from . import query_model as _query_model
 __all__ = [
     'SourceDatabase',
     'DIM_COLUMNS',
@@ -7,3 +10,10 @@ __all__ = [
     'FACT_RELATIONSHIPS',
     'Queries'
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # defer registry loading until one of the pipeline query sets is used
+    if name in ('DIM_COLUMNS', 'DIM_OBJECTS', 'FACT_RELATIONSHIPS'):
+        return getattr(_query_model, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,18 +1,34 @@
+import os
+import sys
 import yaml
+import pickle
+import hashlib
+import tempfile
 
 from pathlib import Path
-from typing import Any, Iterator, Iterable, Tuple
-from dataclasses import dataclass
+from typing import Any, Iterator, Iterable
+from dataclasses import dataclass, field, InitVar
+from functools import lru_cache
+from operator import attrgetter
 
-from collections.abc import Sequence
+from sqlalchemy import text, TextClause
 
 from definitions import PIPELINES
 
+# prefer the libyaml-backed loader; fall back to pure python when it isn't built
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 QUERIES_PATH = Path('db_sources/queries')
 
+# bump when Query's fields or the cached layout change so older pickles are ignored
+REGISTRY_CACHE_VERSION = 1
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Query:
     """
     Representation of a database query's metadata.
@@ -25,75 +41,207 @@ class Query:
         description (str): Human-readable description of the query's purpose.
         order (int): Integer used to determine ordering (e.g., execution or display order).
     Properties:
-        full_path (pathlib.Path): Computed Path obtained by joining QUERIES_PATH with
-            this instance's `path`. QUERIES_PATH is a module constant declared at the top.
+        full_path (pathlib.Path): Path obtained by joining QUERIES_PATH with
+            this instance's `path`, computed once at construction. QUERIES_PATH is a
+            module constant declared at the top.
     Notes:
         - The dataclass is frozen, so instances are immutable.
+        - `existing_paths` is an optional init-only set of known query paths
+          (relative to QUERIES_PATH); when given, it replaces the per-query stat call.
     """
     name: str
     path: str
     description: str
     order: int
-
-    def __post_init__(self):
-        if not self.full_path.exists():
+    existing_paths: InitVar[frozenset[str] | None] = None
+    _full_path: Path = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self, existing_paths: frozenset[str] | None):
+        # frozen dataclass: bypass __setattr__ to store the joined path once
+        object.__setattr__(self, "_full_path", QUERIES_PATH / self.path)
+        if existing_paths is not None:
+            found = self.path in existing_paths
+        else:
+            found = self.full_path.exists()
+        if not found:
             raise FileNotFoundError(
                 f"Query {self.name}'s path ({self.full_path}) does not exist.")
 
     @property
     def full_path(self) -> Path:
-        return QUERIES_PATH / self.path
+        return self._full_path
 
     @property
     def sql_text(self) -> str:
-        return self.full_path.read_text()
-
-
-def _import_queries_from_registry(registry_path: Path = QUERIES_PATH / "registry.yaml") -> dict[str, list[Query]]:
-
-    queries_by_pipeline = {}
+        return _read_sql(self.full_path)
 
-    registry = yaml.safe_load(registry_path.read_text())
+    @property
+    def statement(self) -> TextClause:
+        """SQLAlchemy statement for this query, built once and reused so its compiled form stays cached."""
+        return _build_statement(self.full_path)
 
-    for k, r in [[p, registry[p]] for p in PIPELINES]:
-        queries_by_pipeline[k] = _flatten_registry(r)
 
-    return queries_by_pipeline
+@lru_cache(maxsize=None)
+def _read_sql(path: Path) -> str:
+    """Read a query file once per process; query files are static for a run."""
+    return path.read_text()
 
 
-def _flatten_registry(registry: dict[str, Any]) -> list[Query]:
+@lru_cache(maxsize=None)
+def _build_statement(path: Path) -> TextClause:
+    return text(_read_sql(path))
 
-    queries: list[Query] = []
 
-    for k, v in registry.items():
-        if isinstance(v, dict) and "path" in v.keys():
-            queries.append(Query(**v))
-        elif isinstance(v, dict):
-            queries.extend(_flatten_registry(v))
+@lru_cache
+def _import_queries_from_registry(registry_path: Path = QUERIES_PATH / "registry.yaml") -> dict[str, list[Query]]:
+    """Load and flatten the query registry; parsed once per registry path.
 
-    return queries
+    The flattened result is pickled next to the registry and reused on later
+    runs for as long as the registry file, pipeline list and cache version are
+    unchanged; a per-user cache directory is used when the source tree is
+    read-only. Query files are checked for existence on every load.
+    """
+    stat = registry_path.stat()
+    cache_key = (REGISTRY_CACHE_VERSION, stat.st_mtime_ns, stat.st_size, tuple(PIPELINES))
+    cache_paths = _registry_cache_paths(registry_path)
+    existing_paths = _scan_query_paths()
+
+    cached = _read_registry_cache(cache_paths, cache_key)
+    if cached is not None:
+        # unpickling skips Query.__post_init__, so repeat its query file check here
+        for queries in cached.values():
+            for q in queries:
+                if q.path not in existing_paths:
+                    raise FileNotFoundError(
+                        f"Query {q.name}'s path ({q.full_path}) does not exist.")
+        return cached
 
+    queries_by_pipeline = {}
 
-class Queries(Sequence[Query]):
+    registry = yaml.load(registry_path.read_bytes(), Loader=_YamlLoader)
 
-    def __init__(self, query_list: Iterable[Query]) -> None:
-        self._items: Tuple[Query, ...] = tuple(
-            sorted(query_list, key=lambda q: q.order)
-        )
+    for k, r in [[p, registry[p]] for p in PIPELINES]:
+        queries_by_pipeline[k] = list(_iter_queries(r, existing_paths))
 
-    def __getitem__(self, index: int) -> Query:
-        return self._items[index]
+    _write_registry_cache(cache_paths, cache_key, queries_by_pipeline)
 
-    def __len__(self) -> int:
-        return len(self._items)
+    return queries_by_pipeline
 
-    def __iter__(self) -> Iterator[Query]:
-        return iter(self._items)
 
+def _user_cache_dir() -> Path:
+    """Per-user cache directory for db-dox files (LOCALAPPDATA on Windows, XDG elsewhere)."""
+    base = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME")
+    return (Path(base) if base else Path.home() / ".cache") / "db-dox-etl"
 
-_queries_by_pipeline = _import_queries_from_registry()
 
-DIM_OBJECTS: Queries = Queries(_queries_by_pipeline['dim_objects'])
-DIM_COLUMNS: Queries = Queries(_queries_by_pipeline['dim_columns'])
-FACT_RELATIONSHIPS: Queries = Queries(
-    _queries_by_pipeline['fact_relationships'])
+def _registry_cache_paths(registry_path: Path) -> tuple[Path, Path]:
+    """
+    Cache file locations for a registry, in lookup order.
+    Args:
+        registry_path (Path): Path to the registry YAML file.
+    Returns:
+        tuple[Path, Path]: The cache next to the registry, then a per-user fallback
+            used when the source tree is read-only.
+    """
+    local_path = registry_path.with_name(registry_path.name + ".cache")
+    # one user cache file per registry location
+    digest = hashlib.sha1(str(registry_path.resolve()).encode()).hexdigest()[:16]
+    return local_path, _user_cache_dir() / f"{registry_path.name}.{digest}.cache"
+
+
+def _read_registry_cache(cache_paths: Iterable[Path], cache_key: tuple) -> dict[str, list[Query]] | None:
+    for cache_path in cache_paths:
+        try:
+            with cache_path.open("rb") as f:
+                stored_key, queries_by_pipeline = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError,
+                AttributeError, ImportError, TypeError, ValueError):
+            # missing, unreadable or stale-format cache; try the next location
+            continue
+        if stored_key == cache_key:
+            return queries_by_pipeline
+    return None
+
+
+def _write_registry_cache(cache_paths: Iterable[Path], cache_key: tuple,
+                          queries_by_pipeline: dict[str, list[Query]]) -> None:
+    payload = pickle.dumps((cache_key, queries_by_pipeline), protocol=5)
+    for cache_path in cache_paths:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # write a temp file and swap it in, so concurrent readers never see a partial pickle
+            fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_name, cache_path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+            return
+        except OSError:
+            # read-only location; fall back to the next one, the cache is only an optimization
+            continue
+
+
+def _scan_query_paths(root: Path = QUERIES_PATH) -> frozenset[str]:
+    """Collect every file under the queries directory in one walk, as posix paths relative to root."""
+    paths: set[str] = set()
+    for dirpath, _, filenames in os.walk(root):
+        rel_dir = Path(dirpath).relative_to(root)
+        for filename in filenames:
+            paths.add((rel_dir / filename).as_posix())
+    return frozenset(paths)
+
+
+def _iter_queries(registry: dict[str, Any], existing_paths: frozenset[str] | None = None) -> Iterator[Query]:
+    """Yield every query entry (a dict with a "path" key) nested anywhere in the registry."""
+    stack: list[Any] = [registry]
+
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, dict):
+            continue
+        if "path" in node:
+            # names/descriptions repeat across lookups and logs; share one copy of each
+            fields = {k: sys.intern(v) if isinstance(v, str) else v for k, v in node.items()}
+            yield Query(**fields, existing_paths=existing_paths)
+        else:
+            stack.extend(node.values())
+
+
+class Queries(tuple[Query, ...]):
+    """Immutable tuple of queries sorted by `order`, with a name index for direct lookups."""
+
+    _by_name: dict[str, Query]
+
+    def __new__(cls, query_list: Iterable[Query]) -> "Queries":
+        self = super().__new__(cls, sorted(query_list, key=attrgetter("order")))
+        self._by_name = {q.name: q for q in self}
+        return self
+
+    def by_name(self, name: str) -> Query:
+        """Return the query registered under the given name."""
+        return self._by_name[name]
+
+
+# module attribute name -> pipeline key; built lazily on first access (PEP 562)
+_PIPELINE_CONSTANTS = {
+    "DIM_OBJECTS": "dim_objects",
+    "DIM_COLUMNS": "dim_columns",
+    "FACT_RELATIONSHIPS": "fact_relationships",
+}
+
+DIM_OBJECTS: Queries
+DIM_COLUMNS: Queries
+FACT_RELATIONSHIPS: Queries
+
+
+def __getattr__(name: str) -> Queries:
+    pipeline = _PIPELINE_CONSTANTS.get(name)
+    if pipeline is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    queries = Queries(_import_queries_from_registry()[pipeline])
+    globals()[name] = queries
+    return queries
@@ -1,17 +1,26 @@
-from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Engine
-from typing import Any, Mapping
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Connection, CursorResult, Engine
+from sqlalchemy.pool import QueuePool
+from concurrent.futures import ThreadPoolExecutor
+from types import GeneratorType
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Mapping, Sequence, TypeVar
 
 from app_settings import AppSettings, get_app_settings
 from .query_model import Query
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+T = TypeVar("T")
+
 
 class SourceDatabase:
 
-    def __init__(self, db_name: str, settings: AppSettings = get_app_settings()):
+    def __init__(self, db_name: str, settings: AppSettings | None = None):
         self.name = db_name
-        self.settings = settings
-        self.db_config = settings.get_source_db_by_name(db_name)
+        self.settings = settings if settings is not None else get_app_settings()
+        self.db_config = self.settings.get_source_db_by_name(db_name)
         self.engine: Engine = self._create_engine()
 
     def _create_engine(self) -> Engine:
@@ -19,18 +28,120 @@ class SourceDatabase:
             raise ValueError(
                 f"Source database configuration for database '{self.name}' not found.")
 
-        return create_engine(self.db_config.connection_string)
+        connection_string = self.db_config.connection_string
+        return create_engine(connection_string,
+                             **self.settings.pool.engine_options(connection_string))
+
+    def run_concurrently(self, func: Callable[[Query], T], queries: Sequence[Query],
+                         max_workers: int | None = None) -> list[T]:
+        """
+        Run `func` for each query on a thread pool sharing this database's engine.
+        `func` must consume its results inside the call, e.g.
+        `lambda q: list(db.stream_query(q))`; a generator would be created on the worker
+        but run later, serially, in the caller's thread, so a generator result raises TypeError.
+        Workers are capped at the engine's pool size, since extra threads would only wait
+        on checkout.
+        Args:
+            func (Callable[[Query], T]): Work to run per query; must not return a generator.
+            queries (Sequence[Query]): Independent queries to process.
+            max_workers (int | None): Optional upper bound on worker threads.
+        Returns:
+            list[T]: Results in the same order as `queries`.
+        """
+        if not queries:
+            return []
+
+        def run(query: Query) -> T:
+            result = func(query)
+            if isinstance(result, GeneratorType):
+                result.close()
+                raise TypeError(
+                    f"run_concurrently func returned a generator for query '{query.name}'; "
+                    "consume it inside func, e.g. lambda q: list(db.stream_query(q)).")
+            return result
+
+        # only QueuePool has a size() to share; other pools (e.g. in-memory SQLite) run one worker
+        pool = self.engine.pool
+        pool_size = pool.size() if isinstance(pool, QueuePool) else 1
+        workers = min(len(queries), pool_size, max_workers or pool_size)
 
-    def stream_query(self, sql_query: Query, params: Mapping[str, Any] | None = None, chunk_size: int = 5_000):
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+            return list(executor.map(run, queries))
 
+    @staticmethod
+    def _execute_streaming(conn: Connection, sql_query: Query, params: Mapping[str, Any] | None,
+                           chunk_size: int) -> CursorResult:
+        # yield_per/max_row_buffer keep the driver's buffer in step with fetchmany
+        return conn.execution_options(
+            stream_results=True,
+            yield_per=chunk_size,
+            max_row_buffer=chunk_size,
+        ).execute(sql_query.statement, params or {})
+
+    def stream_query(self, sql_query: Query, params: Mapping[str, Any] | None = None,
+                     chunk_size: int | None = None):
+        chunk_size = chunk_size or self.settings.stream_chunk_size
         with self.engine.connect() as conn:
-            cursor = conn.execution_options(stream_results=True).exec_driver_sql(
-                sql_query.sql_text,
-                params or {}
-            )
+            cursor = self._execute_streaming(conn, sql_query, params, chunk_size)
 
             while True:
                 rows = cursor.fetchmany(chunk_size)
                 if not rows:
                     break
                 yield rows
+
+    def stream_columns(self, sql_query: Query, params: Mapping[str, Any] | None = None,
+                       chunk_size: int | None = None) -> Iterator[dict[str, tuple]]:
+        """
+        Stream query results as column-oriented chunks.
+        Each chunk maps column name -> tuple of values, transposed once per chunk so
+        downstream loaders work per column instead of per row.
+        Args:
+            sql_query (Query): Query to execute.
+            params (Mapping[str, Any] | None): Optional query parameters.
+            chunk_size (int | None): Rows fetched per round trip; defaults to settings.stream_chunk_size.
+        Yields:
+            dict[str, tuple]: Column values for one chunk of rows.
+        """
+        chunk_size = chunk_size or self.settings.stream_chunk_size
+        with self.engine.connect() as conn:
+            cursor = self._execute_streaming(conn, sql_query, params, chunk_size)
+            columns = list(cursor.keys())
+
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield dict(zip(columns, zip(*rows)))
+
+    def invoke_query(self, sql_query: Query, params: Mapping[str, Any] | None = None,
+                     chunk_size: int | None = None) -> "pd.DataFrame":
+        """
+        Run a query and return the full result as a DataFrame.
+        Rows are fetched in chunks straight from the driver cursor and each chunk is
+        handed to pandas as tuples, skipping the per-row mapping work of pd.read_sql_query.
+        Args:
+            sql_query (Query): Query to execute.
+            params (Mapping[str, Any] | None): Optional query parameters.
+            chunk_size (int | None): Rows fetched per round trip; defaults to settings.stream_chunk_size.
+        Returns:
+            pd.DataFrame: Query result.
+        """
+        # pandas is only needed here; importing it at module level slows every CLI start
+        import pandas as pd
+
+        chunk_size = chunk_size or self.settings.stream_chunk_size
+        with self.engine.connect() as conn:
+            cursor = self._execute_streaming(conn, sql_query, params, chunk_size)
+            columns = list(cursor.keys())
+
+            frames = []
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                frames.append(pd.DataFrame.from_records(rows, columns=columns))
+
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(frames, ignore_index=True)
@@ -1,17 +1,26 @@
 from .base import Base
 from .models.meta import (ETLPhase, ETLStep,
-                          ETLRunAudit, ETLStepAudit,
-                          JobEnv, RunTriggerType, Status)
-from .session import get_db_session, connection_test
+                          ETLRunAudit, ETLStepAudit, ETLStepAuditContext,
+                          PhaseType, StepType, ETLEnvironmentType,
+                          ETLStatusCodeType, ETLTriggerType,
+                          log_step_audits, iter_step_audits, StepAuditBuffer)
+from .session import get_engine, get_db_session, connection_test
 __all__ = [
     "Base",
     "ETLPhase",
     "ETLStep",
     "ETLRunAudit",
     "ETLStepAudit",
-    "JobEnv",
-    "RunTriggerType",
-    "Status",
+    "ETLStepAuditContext",
+    "PhaseType",
+    "StepType",
+    "ETLEnvironmentType",
+    "ETLStatusCodeType",
+    "ETLTriggerType",
+    "log_step_audits",
+    "iter_step_audits",
+    "StepAuditBuffer",
+    "get_engine",
     "get_db_session",
     "connection_test",
 ]
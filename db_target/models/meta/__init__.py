@@ -1,2 +1,4 @@
-from .meta import ETLPhase, ETLStep, ETLRunAudit, ETLStepAudit
-from .meta_enums import JobEnv, RunTriggerType, Status
+from .meta import ETLPhase, ETLStep, ETLRunAudit, ETLStepAudit, ETLStepAuditContext
+from .meta_enums import (PhaseType, StepType, ETLEnvironmentType,
+                         ETLStatusCodeType, ETLTriggerType)
+from .meta_audit import log_step_audits, iter_step_audits, StepAuditBuffer
@@ -12,8 +12,14 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     JSON,
+    PrimaryKeyConstraint,
+    text,
+    true,
 )
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql.expression import FunctionElement
 
 from ...base import Base
 from .meta_enums import (
@@ -29,13 +35,79 @@ SCHEMA = "meta"
 TIMEZONE = timezone.utc
 
 
-def get_utc_now() -> datetime:
+def get_utc_now(_now=datetime.now, _tz=TIMEZONE) -> datetime:
     """
     Get the current UTC datetime with timezone info.
+    `datetime.now` and the timezone are bound as defaults, so the per-row call
+    skips global lookups and keyword parsing.
     Returns:
         datetime: Current UTC datetime.
     """
-    return datetime.now(tz=TIMEZONE)
+    return _now(_tz)
+
+
+class utcnow(FunctionElement):
+    """
+    Current UTC timestamp evaluated by the database, for use as a server default.
+    Rendered per dialect by the compile hooks below.
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw) -> str:
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "mssql")
+def _utcnow_mssql(element, compiler, **kw) -> str:
+    return "SYSUTCDATETIME()"
+
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw) -> str:
+    return "(now() AT TIME ZONE 'utc')"
+
+
+@compiles(utcnow, "mysql")
+def _utcnow_mysql(element, compiler, **kw) -> str:
+    return "(UTC_TIMESTAMP())"
+
+
+class new_guid(FunctionElement):
+    """
+    Random GUID text generated by the database, for use as a server default.
+    Rendered per dialect by the compile hooks below.
+    """
+    type = String(36)
+    inherit_cache = True
+
+
+@compiles(new_guid, "mssql")
+def _new_guid_mssql(element, compiler, **kw) -> str:
+    return "NEWID()"
+
+
+@compiles(new_guid, "postgresql")
+def _new_guid_postgresql(element, compiler, **kw) -> str:
+    return "(gen_random_uuid()::text)"
+
+
+@compiles(new_guid, "mysql")
+def _new_guid_mysql(element, compiler, **kw) -> str:
+    return "(UUID())"
+
+
+@compiles(new_guid, "sqlite")
+def _new_guid_sqlite(element, compiler, **kw) -> str:
+    # no uuid function in sqlite; format 16 random bytes as a version 4 uuid
+    return (
+        "(lower(hex(randomblob(4))) || '-' || lower(hex(randomblob(2))) || '-4' || "
+        "substr(lower(hex(randomblob(2))), 2) || '-' || "
+        "substr('89ab', 1 + (abs(random()) % 4), 1) || "
+        "substr(lower(hex(randomblob(2))), 2) || '-' || lower(hex(randomblob(6))))"
+    )
 
 
 class ETLPhase(Base):
@@ -74,10 +146,10 @@ class ETLPhase(Base):
         Integer, nullable=False, unique=True)
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=False), nullable=False, default=get_utc_now
+        DateTime(timezone=False), nullable=False, server_default=utcnow()
     )
     last_updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=False), nullable=False, default=get_utc_now, onupdate=get_utc_now
+        DateTime(timezone=False), nullable=False, server_default=utcnow(), onupdate=get_utc_now
     )
 
     steps: Mapped[list["ETLStep"]] = relationship(back_populates="phase")
@@ -101,8 +173,9 @@ class ETLStep(Base):
     """
     __tablename__ = "etl_step"
     __table_args__ = (
-        Index("ix_etl_step_type", "step_type"),
-        Index("ix_etl_step_phase_order", "etl_phase_id", "step_order"),
+        # step_order restarts per phase; the constraint's index also serves phase/order lookups
+        UniqueConstraint("etl_phase_id", "step_order",
+                         name="uq_etl_step_phase_order"),
         {"schema": SCHEMA},
     )
 
@@ -123,16 +196,17 @@ class ETLStep(Base):
     display_name: Mapped[str] = mapped_column(
         String(150), nullable=False)
     step_order: Mapped[int] = mapped_column(
-        Integer, nullable=False, unique=True)
+        Integer, nullable=False)
     is_active: Mapped[bool] = mapped_column(
-        Boolean, nullable=False, default=True)
-    description: Mapped[str | None] = mapped_column(Text())
+        Boolean, nullable=False, server_default=true())
+    description: Mapped[str | None] = mapped_column(
+        Text(), deferred=True, deferred_group="details")
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=False), nullable=False, default=get_utc_now
+        DateTime(timezone=False), nullable=False, server_default=utcnow()
     )
     last_updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=False), nullable=False, default=get_utc_now, onupdate=get_utc_now
+        DateTime(timezone=False), nullable=False, server_default=utcnow(), onupdate=get_utc_now
     )
 
     phase: Mapped[ETLPhase] = relationship(back_populates="steps")
@@ -163,14 +237,15 @@ class ETLRunAudit(Base):
     __tablename__ = "etl_run_audit"
     __table_args__ = (
         UniqueConstraint("etl_run_guid", name="uq_etl_run_guid"),
-        Index("ix_etl_run_job_start", "job_name", "start_time_utc"),
+        Index("ix_etl_run_job_env_start", "job_name", "environment", "start_time_utc",
+              mssql_include=["status_code"]),
         {"schema": SCHEMA}
     )
 
     id: Mapped[int] = mapped_column(
         BigInteger, primary_key=True, autoincrement=True)
     etl_run_guid: Mapped[str] = mapped_column(
-        String(36), nullable=False, unique=True)
+        String(36), nullable=False, unique=True, server_default=new_guid())
     job_name: Mapped[str] = mapped_column(String(128), nullable=False)
     environment: Mapped[ETLEnvironmentType] = mapped_column(
         SAEnum(
@@ -182,7 +257,7 @@ class ETLRunAudit(Base):
         nullable=False,
     )
     start_time_utc: Mapped[datetime] = mapped_column(
-        DateTime(timezone=False), nullable=False, default=get_utc_now
+        DateTime(timezone=False), nullable=False, server_default=utcnow()
     )
     end_time_utc: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=False))
@@ -194,11 +269,11 @@ class ETLRunAudit(Base):
             validate_strings=True,
         ),
         nullable=False,
-        default=ETLStatusCodeType.STARTED,
+        server_default=ETLStatusCodeType.STARTED.name,
     )
     total_rows_read: Mapped[int | None] = mapped_column(BigInteger)
     total_rows_written: Mapped[int | None] = mapped_column(BigInteger)
-    error_count: Mapped[int | None] = mapped_column(Integer)
+    error_count: Mapped[int | None] = mapped_column(Integer, server_default=text("0"))
     trigger_type: Mapped[ETLTriggerType] = mapped_column(
         SAEnum(
             ETLTriggerType,
@@ -207,10 +282,11 @@ class ETLRunAudit(Base):
             validate_strings=True,
         ),
         nullable=False,
-        default=ETLTriggerType.SCHEDULED,
+        server_default=ETLTriggerType.SCHEDULED.name,
     )
     trigger_user: Mapped[str | None] = mapped_column(String(128))
-    comments: Mapped[str | None] = mapped_column(Text())
+    comments: Mapped[str | None] = mapped_column(
+        Text(), deferred=True, deferred_group="details")
 
     step_audits: Mapped[list["ETLStepAudit"]
                         ] = relationship(back_populates="run")
@@ -235,15 +311,21 @@ class ETLStepAudit(Base):
         end_time_utc (datetime | None): End time of the ETL step in UTC.
         status_code (str): Status of the ETL step.
         error_message (str | None): Error message if the step failed.
-        extra_context_json (dict | None): Additional context for the step as JSON.
 
         run (ETLRunAudit): Relationship to the parent ETLRunAudit model.
         etl_step (ETLStep): Relationship to the ETLStep model.
+        context (ETLStepAuditContext | None): Optional JSON context, stored in a sidecar table.
     """
     __tablename__ = "etl_step_audit"
     __table_args__ = (
-        Index("ix_etl_step_run_step", "etl_run_id", "step_order"),
-        Index("ix_etl_step_time", "start_time_utc"),
+        Index("ix_etl_step_run_step", "etl_run_id", "step_order",
+              mssql_include=["status_code", "rows_written"]),
+        # append-only and time ordered: on SQL Server cluster on time so range scans
+        # and partition switching stay cheap; the id key becomes nonclustered
+        PrimaryKeyConstraint("id", mssql_clustered=False),
+        Index("ix_etl_step_time", "start_time_utc", "id", mssql_clustered=True),
+        Index("ix_etl_step_status_time", "status_code", "start_time_utc",
+              mssql_include=["etl_run_id", "rows_written"]),
         {"schema": SCHEMA}
     )
 
@@ -257,6 +339,7 @@ class ETLStepAudit(Base):
     )
     step_id: Mapped[int] = mapped_column(
         Integer, ForeignKey(f"{SCHEMA}.etl_step.id"), nullable=False)
+    step_order: Mapped[int] = mapped_column(Integer, nullable=False)
 
     source_system: Mapped[str | None] = mapped_column(String(100))
     source_object: Mapped[str | None] = mapped_column(String(256))
@@ -267,7 +350,7 @@ class ETLStepAudit(Base):
     rows_written: Mapped[int | None] = mapped_column(BigInteger)
 
     start_time_utc: Mapped[datetime] = mapped_column(
-        DateTime(timezone=False), nullable=False, default=get_utc_now
+        DateTime(timezone=False), nullable=False, server_default=utcnow()
     )
     end_time_utc: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=False))
@@ -280,11 +363,39 @@ class ETLStepAudit(Base):
             validate_strings=True,
         ),
         nullable=False,
-        default=ETLStatusCodeType.STARTED,
+        server_default=ETLStatusCodeType.STARTED.name,
     )
-    error_message: Mapped[str | None] = mapped_column(Text())
-    extra_context_json: Mapped[dict | None] = mapped_column(JSON())
+    error_message: Mapped[str | None] = mapped_column(
+        Text(), deferred=True, deferred_group="details")
 
     run: Mapped[ETLRunAudit] = relationship(back_populates="step_audits")
     etl_step: Mapped[ETLStep] = relationship(back_populates="step_audits")
     phase: Mapped[ETLPhase] = relationship()
+    context: Mapped["ETLStepAuditContext | None"] = relationship(
+        back_populates="step_audit", cascade="all, delete-orphan")
+
+
+class ETLStepAuditContext(Base):
+    """
+    Step-specific JSON context for an ETLStepAudit row.
+    Kept out of etl_step_audit so scans of the audit table never touch the
+    large, rarely read JSON values; rows exist only for steps that have context.
+    Attributes:
+        etl_step_audit_id (int): Primary key and foreign key to the ETLStepAudit model.
+        extra_context_json (dict): Additional context for the step as JSON.
+        created_at (datetime): Timestamp of creation in UTC.
+
+        step_audit (ETLStepAudit): Relationship to the owning ETLStepAudit model.
+    """
+    __tablename__ = "etl_step_audit_context"
+    __table_args__ = {"schema": SCHEMA}
+
+    etl_step_audit_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey(f"{SCHEMA}.etl_step_audit.id"), primary_key=True)
+    extra_context_json: Mapped[dict] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=False), nullable=False, server_default=utcnow()
+    )
+
+    step_audit: Mapped[ETLStepAudit] = relationship(back_populates="context")
@@ -0,0 +1,138 @@
+from typing import Any, Iterable, Iterator, Mapping, Sequence
+
+from sqlalchemy import ColumnElement, insert, select
+from sqlalchemy.orm import Session, undefer_group
+from sqlalchemy.sql.base import ExecutableOption
+
+from .meta import ETLStepAudit, ETLStepAuditContext
+
+
+# rows per INSERT ... RETURNING batch written by StepAuditBuffer
+STEP_AUDIT_BATCH_SIZE = 500
+
+# rows held in memory at a time when reading step audits back
+STEP_AUDIT_YIELD_PER = 1000
+
+
+def log_step_audits(session: Session, rows: Iterable[Mapping[str, Any]],
+                    return_ids: bool = False) -> list[int] | None:
+    """
+    Write step audit records in a single executemany INSERT and commit.
+    Collect a phase's step audits in memory and flush them here instead of
+    adding and committing one ORM object per step. An optional "extra_context_json"
+    value per row is written to the ETLStepAuditContext sidecar table.
+    Without context rows and without `return_ids` this is a plain executemany,
+    which pyodbc sends with fast_executemany on SQL Server; otherwise the audits
+    are inserted with RETURNING id in parameter order.
+    Args:
+        session (Session): Active database session.
+        rows (Iterable[Mapping[str, Any]]): Column -> value mappings for ETLStepAudit rows.
+        return_ids (bool): Return the inserted ids even when no row has context.
+    Returns:
+        list[int] | None: Ids of the inserted ETLStepAudit rows in input order, or None
+            when they were not fetched.
+    """
+    rows = [dict(row) for row in rows]
+    if not rows:
+        return [] if return_ids else None
+
+    contexts = [row.pop("extra_context_json", None) for row in rows]
+    if not return_ids and all(context is None for context in contexts):
+        session.execute(insert(ETLStepAudit), rows)
+        session.commit()
+        return None
+
+    audit_ids = session.scalars(
+        insert(ETLStepAudit).returning(ETLStepAudit.id, sort_by_parameter_order=True),
+        rows,
+    ).all()
+
+    context_rows = [
+        {"etl_step_audit_id": audit_id, "extra_context_json": context}
+        for audit_id, context in zip(audit_ids, contexts)
+        if context is not None
+    ]
+    if context_rows:
+        session.execute(insert(ETLStepAuditContext), context_rows)
+    session.commit()
+    return list(audit_ids)
+
+
+class StepAuditBuffer:
+    """
+    Buffer step audit rows for a run and write them with log_step_audits in batches,
+    so N step completions cost ceil(N / batch_size) commits instead of N.
+    Use as a context manager so the remaining rows are written when the run ends.
+    One buffer belongs to one run and its session; it is not shared between threads.
+    Attributes:
+        session (Session): Session the batches are written with.
+        batch_size (int): Buffered rows that trigger a write.
+        return_ids (bool): Fetch the id of every written row into audit_ids.
+        audit_ids (list[int]): Ids of all rows written so far, in insertion order;
+            only filled when return_ids is set.
+    """
+
+    def __init__(self, session: Session, batch_size: int = STEP_AUDIT_BATCH_SIZE,
+                 return_ids: bool = False):
+        self.session = session
+        self.batch_size = batch_size
+        self.return_ids = return_ids
+        self.audit_ids: list[int] = []
+        self._rows: list[Mapping[str, Any]] = []
+
+    def add(self, row: Mapping[str, Any]) -> None:
+        """
+        Buffer one ETLStepAudit row, writing the batch once it is full.
+        Args:
+            row (Mapping[str, Any]): Column -> value mapping for an ETLStepAudit row.
+        """
+        self._rows.append(row)
+        if len(self._rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write and commit any buffered rows."""
+        if self._rows:
+            rows, self._rows = self._rows, []
+            audit_ids = log_step_audits(self.session, rows, self.return_ids)
+            if self.return_ids:
+                self.audit_ids.extend(audit_ids)
+
+    def __enter__(self) -> "StepAuditBuffer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # audits of a failing run are still written
+        self.flush()
+
+
+def iter_step_audits(session: Session, *criteria: ColumnElement[bool],
+                     yield_per: int = STEP_AUDIT_YIELD_PER,
+                     options: Sequence[ExecutableOption] = (undefer_group("details"),)
+                     ) -> Iterator[ETLStepAudit]:
+    """
+    Stream ETLStepAudit rows in start time order over a server-side cursor.
+    Only `yield_per` rows are buffered at a time, so reporting over the whole
+    audit table keeps a bounded working set instead of materializing every row.
+    The cursor holds the session's connection until iteration ends, so every
+    column read from the yielded rows must be loaded by the statement: the
+    deferred "details" group (error_message) is undeferred by default, and
+    relationships such as `context` must be eager-loaded through `options`
+    (e.g. selectinload), never lazy-loaded mid-stream. A lazy load issues one
+    query per row and fails on SQL Server connections without MARS.
+    Args:
+        session (Session): Active database session.
+        *criteria (ColumnElement[bool]): Optional WHERE criteria, e.g. ETLStepAudit.etl_run_id == 1.
+        yield_per (int): Rows fetched and buffered per batch.
+        options (Sequence[ORMOption]): Loader options applied to the select.
+    Yields:
+        ETLStepAudit: Step audit rows.
+    """
+    statement = (
+        select(ETLStepAudit)
+        .options(*options)
+        .where(*criteria)
+        .order_by(ETLStepAudit.start_time_utc, ETLStepAudit.id)
+        .execution_options(stream_results=True, yield_per=yield_per)
+    )
+    yield from session.scalars(statement)
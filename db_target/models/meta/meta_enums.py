@@ -1,13 +1,13 @@
-from enum import Enum
+from enum import StrEnum
 
 
-class PhaseType(str, Enum):
+class PhaseType(StrEnum):
     APPLICATION = "application"
     PIPELINE = "pipeline"
     AUDIT = "audit"
 
 
-class StepType(str, Enum):
+class StepType(StrEnum):
     APPLICATION_PIPELINE_START = "application.pipeline.start"
     APPLICATION_PIPELINE_END = "application.pipeline.end"
     PIPELINE_DOCDB_DIM_OBJECTS = "pipeline.docdb.dim_objects"
@@ -16,14 +16,14 @@ class StepType(str, Enum):
     AUDIT_DOCDB_LOAD = "audit.docdb.load"
 
 
-class ETLEnvironmentType(str, Enum):
+class ETLEnvironmentType(StrEnum):
     DEV = "DEV"
     TEST = "TEST"
     QA = "QA"
     PROD = "PROD"
 
 
-class ETLStatusCodeType(str, Enum):
+class ETLStatusCodeType(StrEnum):
     STARTED = "STARTED"
     SUCCESS = "SUCCESS"
     FAILED = "FAILED"
@@ -31,7 +31,7 @@ class ETLStatusCodeType(str, Enum):
     SKIPPED = "SKIPPED"
 
 
-class ETLTriggerType(str, Enum):
+class ETLTriggerType(StrEnum):
     SCHEDULED = "SCHEDULED"
     MANUAL = "MANUAL"
     API = "API"
@@ -1,65 +1,117 @@
+from functools import lru_cache
+
+from sqlalchemy import Insert, insert, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
 from db_target import get_db_session
-from definitions import PHASES, STEPS, PHASE_BY_ID, EtlPhaseDefinition, EtlStepDefinition
+from definitions import PHASES, STEPS, EtlPhaseDefinition, EtlStepDefinition
 
 from db_target.models.meta.meta import ETLPhase, ETLStep as ETLStepModel
+from db_target.models.meta.meta_enums import PhaseType, StepType
+
+
+# dialects whose insert() supports ON CONFLICT DO NOTHING
+ON_CONFLICT_INSERTS = {
+    "postgresql": postgresql_insert,
+    "sqlite": sqlite_insert,
+}
+
+# built once; with the engine's query_cache_size each statement compiles once per process
+PHASE_IDS_SELECT = select(ETLPhase.phase_type, ETLPhase.id)
 
 
-SESSION = get_db_session()
+def _phase_row(phase_def: EtlPhaseDefinition) -> dict:
+    """
+    Map a phase definition to ETLPhase column values.
+    Args:
+        phase_def (EtlPhaseDefinition): Phase definition from etl_steps_and_phases.json.
+    Returns:
+        dict: Column values for a bulk insert."""
+    return {
+        "phase_type": PhaseType(phase_def.key.lower()),
+        "display_name": phase_def.name,
+        "description": phase_def.description,
+        "sort_order": phase_def.id,
+    }
 
 
-def add_phase(phase_def: EtlPhaseDefinition) -> ETLPhase:
+def _step_row(step_def: EtlStepDefinition, etl_phase_id: int) -> dict:
     """
-    Add an ETL phase if it does not already exist.
+    Map a step definition to ETLStep column values.
     Args:
-        phase_name (str): Name of the ETL phase.
-        description (str | None): Optional description of the phase.
+        step_def (EtlStepDefinition): Step definition from etl_steps_and_phases.json.
+        etl_phase_id (int): Database id of the step's phase.
     Returns:
-        ETLPhase: The existing or newly created ETLPhase object."""
-    phase = SESSION.query(ETLPhase).filter(
-        ETLPhase.name == phase_def.name).one_or_none()
-    if phase is None:
-        phase = ETLPhase(id=phase_def.id, name=phase_def.name,
-                         description=phase_def.description)
-        SESSION.add(phase)
-        SESSION.commit()
-    return phase
-
-
-def add_step(step_def: EtlStepDefinition, phase: ETLPhase) -> ETLStepModel:
+        dict: Column values for a bulk insert."""
+    return {
+        "etl_phase_id": etl_phase_id,
+        "step_type": StepType(step_def.code),
+        "display_name": step_def.name,
+        "step_order": step_def.step_order,
+        "description": step_def.description,
+    }
+
+
+@lru_cache
+def _insert_statement(dialect_name: str, model: type, key: str) -> Insert:
     """
-    Add an ETL step if it does not already exist.
+    Build the seed INSERT for a dialect and model once.
     Args:
-        step_name (str): Name of the ETL step.
-        step_code (str): Code of the ETL step.
-        phase (ETLPhase): The ETLPhase object this step belongs to.
-        description (str | None): Optional description of the step.
+        dialect_name (str): Name of the session's dialect.
+        model (type): Mapped model to insert into.
+        key (str): Unique column identifying a row.
     Returns:
-        ETLStepModel: The existing or newly created ETLStep object."""
-    step = SESSION.query(ETLStepModel).filter(
-        ETLStepModel.name == step_def.name).one_or_none()
-    if step is None:
-        step = ETLStepModel(phase_id=phase.id, name=step_def.name,
-                            code=step_def.code, phase=phase,
-                            description=step_def.description)
-        SESSION.add(step)
-        SESSION.commit()
-    return step
-
-
-def seed_etl_phases_and_steps() -> None:
+        Insert: ON CONFLICT DO NOTHING insert where supported, plain insert otherwise.
     """
-    Seed the ETLPhase and ETLStep tables based on the EtlStep enum.
-    This function checks for existing phases and steps to avoid duplicates.
+    dialect_insert = ON_CONFLICT_INSERTS.get(dialect_name)
+    if dialect_insert is None:
+        return insert(model)
+    return dialect_insert(model).on_conflict_do_nothing(index_elements=[key])
+
+
+def _insert_missing(session: Session, model: type, rows: list[dict], key: str) -> None:
+    """
+    Insert rows whose `key` column is not stored yet, in one executemany.
+    PostgreSQL and SQLite skip duplicates server side with ON CONFLICT DO NOTHING;
+    other dialects (SQL Server) diff against the stored keys first.
+    Args:
+        session (Session): Session to execute in; the caller commits.
+        model (type): Mapped model to insert into.
+        rows (list[dict]): Column values per row.
+        key (str): Unique column identifying a row.
+    """
+    dialect_name = session.get_bind().dialect.name
+    statement = _insert_statement(dialect_name, model, key)
+    if dialect_name not in ON_CONFLICT_INSERTS:
+        existing = set(session.execute(select(getattr(model, key))).scalars())
+        rows = [row for row in rows if row[key] not in existing]
+    if rows:
+        session.execute(statement, rows)
+
+
+def seed_etl_phases_and_steps(session: Session | None = None) -> None:
+    """
+    Seed the ETLPhase and ETLStep tables from the ETL definitions.
+    Phases and steps are each written with a single idempotent bulk insert and
+    committed in one transaction.
+    Args:
+        session (Session | None): Session to use; a new one is opened and closed if omitted.
     """
+    if session is None:
+        with get_db_session() as session:
+            return seed_etl_phases_and_steps(session)
 
-    current_phase: EtlPhaseDefinition | None = None
+    _insert_missing(session, ETLPhase, [_phase_row(p) for p in PHASES], "phase_type")
 
-    for step_def in STEPS:
-        phase_def = PHASE_BY_ID[step_def.phase_id]
-        if current_phase is None or current_phase != phase_def:
-            current_phase = phase_def
-            phase = add_phase(phase_def)
+    # definitions reference phases by definition id; map to the database id
+    phase_ids: dict[PhaseType, int] = dict(session.execute(PHASE_IDS_SELECT).all())
+    phase_id_by_def = {
+        phase_def.id: phase_ids[PhaseType(phase_def.key.lower())] for phase_def in PHASES}
 
-        add_step(step_def, phase)
+    _insert_missing(session, ETLStepModel,
+                    [_step_row(s, phase_id_by_def[s.phase_id]) for s in STEPS],
+                    "step_type")
 
-    SESSION.close()
+    session.commit()
@@ -1,20 +1,45 @@
-from app_settings import get_app_settings
+from functools import lru_cache
+
+from app_settings import get_app_settings, SqlType
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
 
 from sqlalchemy.orm import sessionmaker, Session
 
-# create/get app settings
-settings = get_app_settings()
+# compiled statement cache entries; audit and seed inserts repeat the same statements
+QUERY_CACHE_SIZE = 1200
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """Get the process-wide engine for the documentation database.
+    Built on first use, so importing db_target does no database work.
+    Returns:
+        Engine: Shared SQLAlchemy engine.
+    """
+    settings = get_app_settings()
+    if not settings.dox_db:
+        raise ValueError("Database settings are not configured properly.")
+
+    connection_string = settings.dox_db.connection_string
+    engine_options = settings.pool.engine_options(connection_string)
+    engine_options["query_cache_size"] = QUERY_CACHE_SIZE
+    if settings.dox_db.db_type == SqlType.SQLSERVER:
+        # pyodbc-only option: send executemany parameter sets as one array
+        engine_options["fast_executemany"] = True
 
-# create connection string
-if not settings.dox_db:
-    raise ValueError("Database settings are not configured properly.")
+    return create_engine(connection_string, echo=False, future=True, **engine_options)
 
-CONNECTION_STRING = settings.dox_db.connection_string
 
-# Create the SQLAlchemy engine and session factory
-engine = create_engine(CONNECTION_STRING, echo=False, future=True)
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+@lru_cache(maxsize=1)
+def get_session_factory() -> sessionmaker[Session]:
+    """Get the session factory bound to the shared engine.
+    Returns:
+        sessionmaker[Session]: Cached session factory.
+    """
+    # expire_on_commit=False: committed objects keep their loaded state without a reload query
+    return sessionmaker(bind=get_engine(), autoflush=False, autocommit=False,
+                        expire_on_commit=False)
 
 
 # function to expose for getting a database session
@@ -23,7 +48,7 @@ def get_db_session() -> Session:
     Returns:
         Session: A new SQLAlchemy session.
     """
-    return SessionLocal()
+    return get_session_factory()()
 
 
 # function to test the database connection
@@ -33,6 +58,7 @@ def connection_test() -> bool:
     Returns:
         bool: True if the connection is successful, False otherwise.
     """
+    engine = get_engine()
     test_result = False
     try:
         connection = engine.connect()
@@ -1,5 +1,5 @@
 from .etl_definitions import (PHASES, STEPS, PHASE_BY_KEY, PHASE_BY_ID,
-                              STEP_BY_KEY, STEP_BY_ID, PIPELINES, iter_steps_in_phase,
+                              STEP_BY_KEY, STEP_BY_ID, STEPS_BY_PHASE_ID, PIPELINES, iter_steps_in_phase,
                               get_phase_of_step, EtlPhaseDefinition,
                               EtlStepDefinition)
 __all__ = [
@@ -9,6 +9,7 @@ __all__ = [
     "PHASE_BY_ID",
     "STEP_BY_KEY",
     "STEP_BY_ID",
+    "STEPS_BY_PHASE_ID",
     "PIPELINES",
     "iter_steps_in_phase",
     "get_phase_of_step",
@@ -1,5 +1,5 @@
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Final, Iterable
 import json
 
@@ -8,7 +8,7 @@ etl_defs_path: Path = Path("definitions\\etl_steps_and_phases.json")
 
 
 # ETL Phase Definition Dataclass
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EtlPhaseDefinition:
     id: int
     key: str
@@ -17,7 +17,7 @@ class EtlPhaseDefinition:
 
 
 # ETL Step Definition Dataclass
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EtlStepDefinition:
     id: int
     phase_id: int
@@ -26,6 +26,12 @@ class EtlStepDefinition:
     code: str
     step_order: int
     description: str | None = None
+    # name of the owning phase, resolved once from PHASE_BY_ID at construction
+    phase_name: str = field(init=False, compare=False)
+
+    def __post_init__(self):
+        # frozen dataclass: bypass __setattr__; an unknown phase_id raises KeyError
+        object.__setattr__(self, "phase_name", PHASE_BY_ID[self.phase_id].name)
 
 
 # Load ETL Definitions from JSON
@@ -35,30 +41,32 @@ etl_definitions = json.loads(etl_defs_path.read_text())
 PHASES: Final[list[EtlPhaseDefinition]] = [
     EtlPhaseDefinition(**phase) for phase in etl_definitions["phases"]
 ]
-STEPS: Final[list[EtlStepDefinition]] = [
-    EtlStepDefinition(**step) for step in etl_definitions["steps"]
-]
 
 # Convenience lookup by key and id (useful both in app code and tests).
 PHASE_BY_KEY: Final[dict[str, EtlPhaseDefinition]] = {p.key: p for p in PHASES}
 PHASE_BY_ID: Final[dict[int, EtlPhaseDefinition]] = {p.id: p for p in PHASES}
 
+STEPS: Final[list[EtlStepDefinition]] = [
+    EtlStepDefinition(**step) for step in etl_definitions["steps"]
+]
+
 STEP_BY_KEY: Final[dict[str, EtlStepDefinition]] = {s.key: s for s in STEPS}
 STEP_BY_ID: Final[dict[int, EtlStepDefinition]] = {s.id: s for s in STEPS}
+STEPS_BY_PHASE_ID: Final[dict[int, tuple[EtlStepDefinition, ...]]] = {
+    pid: tuple(s for s in STEPS if s.phase_id == pid) for pid in PHASE_BY_ID
+}
 
 PIPELINES: Final[list[str]] = [
-    p.code.split('.')[-1] for p in sorted(
-        [s for s in STEPS if s.phase_id == PHASE_BY_KEY['PIPELINE'].id],
+    p.code.rpartition('.')[2] for p in sorted(
+        STEPS_BY_PHASE_ID[PHASE_BY_KEY['PIPELINE'].id],
         key=lambda st: st.step_order
     )
 ]
 
 
 def iter_steps_in_phase(phase_key: str) -> Iterable[EtlStepDefinition]:
-    """Yield all ETL steps belonging to the specified phase key."""
-    phase = PHASE_BY_KEY[phase_key]
-
-    return (step for step in STEPS if step.phase_id == phase.id)
+    """Return all ETL steps belonging to the specified phase key, in definition order."""
+    return STEPS_BY_PHASE_ID[PHASE_BY_KEY[phase_key].id]
 
 
 def get_phase_of_step(step: EtlStepDefinition) -> EtlPhaseDefinition:
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from app_settings import get_app_settings, AppSettings, LogLevel
 
@@ -12,10 +13,8 @@ DEFAULT_EXTRA_FIELDS = [
     "etl_step"
 ]
 
-settings = get_app_settings()
 
-
-@dataclass
+@dataclass(slots=True)
 class ETLLogConstants:
     """Constants for ETL logging configuration.
     Attributes:
@@ -42,9 +41,10 @@ class ETLLogConstants:
         self.json_log = settings.log.json_log
 
 
+@lru_cache(maxsize=1)
 def get_constants() -> ETLLogConstants:
-    """Load ETL logging constants from application settings."""
-    return ETLLogConstants(settings)
+    """Load ETL logging constants from application settings, once per process."""
+    return ETLLogConstants(get_app_settings())
 
 
 if __name__ == "__main__":
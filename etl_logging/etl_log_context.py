@@ -1,15 +1,9 @@
-from enum import StrEnum
 from typing import Optional
-from dataclasses import dataclass, asdict
 
-from app_settings import get_app_settings, AppSettings, LogLevel
-from definitions import EtlPhaseDefinition, EtlStepDefinition, get_phase_of_step
+from app_settings import get_app_settings
+from definitions import EtlStepDefinition
 
 
-settings = get_app_settings()
-
-
-@dataclass
 class ETLLogContext:
     """
     Contextual information for ETL logging.
@@ -27,24 +21,55 @@ class ETLLogContext:
         to_bind_kwargs() -> dict:
             Convert the context to a dictionary for logger binding.
     """
+    __slots__ = ("source_db_name", "etl_phase", "etl_step", "etl_run_guid", "_cached_kwargs")
+
     source_db_name: str
     etl_phase: str
     etl_step: str
-    etl_run_guid: str = settings.log.run_guid
+    etl_run_guid: str
+    _cached_kwargs: Optional[dict]
 
     def __init__(self, source_db_name: Optional[str] = None,
                  etl_step: Optional[EtlStepDefinition] = None):
+        self.etl_run_guid = get_app_settings().log.run_guid
         self.source_db_name = source_db_name if source_db_name is not None else "-"
         self.etl_step = etl_step.code if etl_step is not None else "-"
-        self.etl_phase = get_phase_of_step(
-            etl_step).name if etl_step is not None else "-"
+        self.etl_phase = etl_step.phase_name if etl_step is not None else "-"
+
+    def __setattr__(self, name: str, value: object) -> None:
+        # any context change, through update_* or direct assignment, drops the memoized kwargs
+        object.__setattr__(self, name, value)
+        if name != "_cached_kwargs":
+            object.__setattr__(self, "_cached_kwargs", None)
+
+    def __repr__(self) -> str:
+        return (f"ETLLogContext(source_db_name={self.source_db_name!r}, "
+                f"etl_phase={self.etl_phase!r}, etl_step={self.etl_step!r}, "
+                f"etl_run_guid={self.etl_run_guid!r})")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ETLLogContext):
+            return NotImplemented
+        return (self.source_db_name, self.etl_phase, self.etl_step, self.etl_run_guid) == (
+            other.source_db_name, other.etl_phase, other.etl_step, other.etl_run_guid)
+
+    __hash__ = None
 
     def update_step(self, etl_step: EtlStepDefinition) -> None:
         self.etl_step = etl_step.code
-        self.etl_phase = get_phase_of_step(etl_step).name
+        self.etl_phase = etl_step.phase_name
 
     def update_source_db_name(self, source_db_name: str) -> None:
         self.source_db_name = source_db_name
 
     def to_bind_kwargs(self) -> dict:
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        # built by hand and memoized until a context field is assigned; callers must not mutate it
+        if self._cached_kwargs is None:
+            kwargs = {
+                "source_db_name": self.source_db_name,
+                "etl_phase": self.etl_phase,
+                "etl_step": self.etl_step,
+                "etl_run_guid": self.etl_run_guid,
+            }
+            self._cached_kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        return self._cached_kwargs
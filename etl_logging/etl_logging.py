@@ -15,12 +15,14 @@ This module centralizes Loguru configuration and provides helpers for:
 """
 
 import sys
+import json
 import time
 import loguru
 import logging
+import traceback
 
 from pathlib import Path
-from functools import wraps
+from functools import lru_cache, wraps
 from loguru import logger as _base_logger
 from typing import Callable, Optional, Any
 
@@ -28,42 +30,81 @@ from .etl_log_context import ETLLogContext
 from .etl_log_constants import ETLLogConstants, get_constants, DEFAULT_EXTRA_FIELDS
 
 
-# constants
-CONSTANTS = get_constants()
+# the padded ETL context columns are prebuilt by _console_format into extra[console_context]
+CONSOLE_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+    "<level>{level: <8}</level> | "
+    "{extra[console_context]} | "
+    "{message}\n{exception}"
+)
+
+# records at or above this level go to the console error sink with full diagnostics
+_ERROR_LEVEL_NO = logging.ERROR
+_INFO_LEVEL_NO = logging.INFO
+
+# lowest level any sink accepts; set by configure_logging, everything passes until then
+_MIN_LEVEL_NO = 0
 
 
 # --- Intercept standard logging and redirect to Loguru ------------------------
 
 
+# stdlib level name -> Loguru level (name, or number for unknown levels)
+_LEVEL_CACHE: dict[str, str | int] = {}
+
+
 class InterceptHandler(logging.Handler):
     """Redirect standard logging calls into Loguru."""
 
     def emit(self, record: logging.LogRecord) -> None:
-        try:
-            level = _base_logger.level(record.levelname).name
-        except ValueError:
-            level = record.levelno
+        level = _LEVEL_CACHE.get(record.levelname)
+        if level is None:
+            try:
+                level = _base_logger.level(record.levelname).name
+            except ValueError:
+                level = record.levelno
+            _LEVEL_CACHE[record.levelname] = level
+
+        # Forward through the patched logger so default extras are present for sink formats
+        if record.exc_info:
+            logger.opt(depth=6, exception=record.exc_info).log(
+                level, record.getMessage())
+        else:
+            logger.opt(depth=6).log(level, record.getMessage())
 
-        # Forward to Loguru, preserving exception info
-        _base_logger.opt(
-            depth=6,
-            exception=record.exc_info
-        ).log(level, record.getMessage())
+
+# the one handler installed on the stdlib root logger
+_INTERCEPT_HANDLER = InterceptHandler()
 
 
 def intercept_stdlib_logging() -> None:
     """
     Route the stdlib `logging` module logs (used by many libraries) into Loguru.
     This avoids split outputs between two logging systems.
+    Repeated calls return immediately while the handler is still installed.
     """
-    logging.basicConfig(handlers=[InterceptHandler()], level=0)
-    for name in logging.root.manager.loggerDict.keys():
-        logging.getLogger(name).handlers = [InterceptHandler()]
+    if logging.root.handlers == [_INTERCEPT_HANDLER]:
+        return
+
+    # a single handler on the root; every logger reaches it through propagation,
+    # including loggers libraries create after this call
+    logging.root.handlers = [_INTERCEPT_HANDLER]
+    logging.root.setLevel(0)
+
+    # loggers created before this call: drop their own handlers so records are not doubled
+    for existing in logging.root.manager.loggerDict.values():
+        if isinstance(existing, logging.Logger):
+            existing.handlers = []
+            existing.propagate = True
 
 
 # --- Base logger with default extra fields ------------------------------------
 
 
+# placeholder for every default extra field; merged under each record's own extras
+_DEFAULT_EXTRAS = dict.fromkeys(DEFAULT_EXTRA_FIELDS, "-")
+
+
 def _add_default_extra(record: Any) -> None:
     """
     Create ETL context records and add default values if missing.
@@ -71,63 +112,133 @@ def _add_default_extra(record: Any) -> None:
     Args:
         record (Any): The Loguru log record to modify.
     """
-    extra = record["extra"]
-
-    for field in DEFAULT_EXTRA_FIELDS:
-        extra.setdefault(field, "-")
-    # No return; we mutate in place
+    # one dict merge; bound extras win over the defaults
+    record["extra"] = _DEFAULT_EXTRAS | record["extra"]
 
 
 # This is the base logger patched with default extras.
 logger = _base_logger.patch(_add_default_extra)
 
 
+@lru_cache(maxsize=256)
+def _console_context(source_db_name: str, etl_phase: str, etl_step: str) -> str:
+    """Pad the ETL context columns of a console line once per distinct context."""
+    return f"{source_db_name: <25} | {etl_phase: <25} | {etl_step: <25}"
+
+
+def _console_format(record: Any) -> str:
+    """
+    Format callable for the console sinks.
+    The three padded context columns are built in one cached call instead of
+    three format-spec lookups per line. The returned template is constant, so
+    Loguru's colorized template cache is hit on every record.
+    Args:
+        record (Any): The Loguru log record to format.
+    Returns:
+        str: The console format string.
+    """
+    extra = record["extra"]
+    # str() keeps the cache key hashable whatever was bound (lists, dicts, ...)
+    extra["console_context"] = _console_context(
+        str(extra["source_db_name"]), str(extra["etl_phase"]), str(extra["etl_step"]))
+    return CONSOLE_FORMAT
+
+
+def _below_error(record: Any) -> bool:
+    """Pass records below ERROR; ERROR and above go to the diagnosing console sink."""
+    return record["level"].no < _ERROR_LEVEL_NO
+
+
+def _json_format(record: Any) -> str:
+    """
+    Format a record as one compact JSON line for the structured log sink.
+    Serializes only time, level, message, extras and any exception, rather than
+    Loguru's full serialize=True payload (text, file, process, thread, ...).
+    Args:
+        record (Any): The Loguru log record to format.
+    Returns:
+        str: Loguru format string reading the serialized line from the record.
+    """
+    # console-only column set by _console_format; not part of the structured record
+    record["extra"].pop("console_context", None)
+    payload = {
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "message": record["message"],
+        **record["extra"],
+    }
+    if record["exception"] is not None:
+        payload["exception"] = "".join(
+            traceback.format_exception(*record["exception"]))
+    record["extra"]["serialized"] = json.dumps(
+        payload, default=str, separators=(",", ":"))
+    return "{extra[serialized]}\n"
+
+
 # --- Public configuration function -------------------------------------------
 
 
 def configure_logging(
-    logging_constants: ETLLogConstants = CONSTANTS,
+    logging_constants: Optional[ETLLogConstants] = None,
     logger: loguru.Logger = logger,
 ) -> loguru.Logger:
     """
     Configure Loguru logging for db-dox-phase-1-etl.
 
     Parameters:
-        logging_constants (ETLLogConstants): Configuration constants for logging.
+        logging_constants (Optional[ETLLogConstants]): Configuration constants for logging.
+            Defaults to the cached get_constants() result.
         logger (loguru.Logger): The Loguru logger instance to configure.
     Returns:
         loguru.Logger: The configured Loguru logger instance.
     """
+    global _MIN_LEVEL_NO
+
+    if logging_constants is None:
+        logging_constants = get_constants()
+
+    # LogLevel values are lowercase; Loguru level names are uppercase
+    console_log_level = logging_constants.console_log_level.upper()
+    file_log_level = logging_constants.file_log_level.upper()
+    _MIN_LEVEL_NO = min(_base_logger.level(console_log_level).no,
+                        _base_logger.level(file_log_level).no)
+    # the error sink never goes below the configured console level
+    console_error_level = max(console_log_level, "ERROR",
+                              key=lambda name: _base_logger.level(name).no)
 
     # Remove all existing sinks
     logger.remove()
 
     # --- Console Sink (human-friendly) ---
+    # below ERROR: no frame walking or locals introspection on the high-volume path
     logger.add(
         sys.stderr,
-        level=logging_constants.console_log_level.value,
+        level=console_log_level,
+        colorize=True,
+        backtrace=False,
+        diagnose=False,
+        filter=_below_error,
+        format=_console_format,
+    )
+
+    # --- Console Error Sink (full diagnostics) ---
+    logger.add(
+        sys.stderr,
+        level=console_error_level,
         colorize=True,
         backtrace=True,
         diagnose=True,
-        format=(
-            "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-            "<level>{level: <8}</level> | "
-            "{extra[source_db_name]: <25} | "
-            "{extra[etl_phase]: <25} | "
-            "{extra[etl_step]: <25} | "
-            "{message}"
-        ),
+        format=_console_format,
     )
 
     # --- Rotating File Sink (text) ---
     logger.add(
         logging_constants.log_directory / f"{logging_constants.app_name}.log",
-        level=logging_constants.file_log_level.value,
+        level=file_log_level,
         rotation="7 days",
         retention="30 days",
         compression="zip",
         encoding="utf-8",
-        enqueue=True,  # safe for multiprocessing
         backtrace=True,
         diagnose=False,
     )
@@ -137,12 +248,11 @@ def configure_logging(
         logger.add(
             logging_constants.log_directory /
             f"{logging_constants.app_name}.json",
-            level=logging_constants.file_log_level.value,
+            level=file_log_level,
             rotation="7 days",
             retention="30 days",
             encoding="utf-8",
-            enqueue=True,
-            serialize=True,  # output JSON
+            format=_json_format,  # one compact JSON object per line
         )
 
     # Route stdlib logging (for libraries) into Loguru
@@ -158,6 +268,13 @@ def configure_logging(
 # --- Helpers for ETL context --------------------------------------------------
 
 
+# context fields bound by get_etl_logger, in cache key order
+_CONTEXT_FIELDS = ("source_db_name", "etl_phase", "etl_step", "etl_run_guid")
+
+# (source_db_name, etl_phase, etl_step, etl_run_guid) -> logger bound with that context
+_BOUND_LOGGER_CACHE: dict[tuple, loguru.Logger] = {}
+
+
 def get_etl_logger(
     logger_context: Optional[ETLLogContext] = None
 ) -> loguru.Logger:
@@ -173,7 +290,16 @@ def get_etl_logger(
     if logger_context is None:
         logger_context = ETLLogContext()
 
-    return logger.bind(**logger_context.to_bind_kwargs())
+    # bound loggers only carry extras, so one per distinct context is reused by every caller
+    key = (logger_context.source_db_name, logger_context.etl_phase,
+           logger_context.etl_step, logger_context.etl_run_guid)
+    bound = _BOUND_LOGGER_CACHE.get(key)
+    if bound is None:
+        # bind from the key itself so a cached logger always carries the context it is keyed on
+        bound = logger.bind(**{name: value for name, value in zip(_CONTEXT_FIELDS, key)
+                               if value is not None})
+        _BOUND_LOGGER_CACHE[key] = bound
+    return bound
 
 
 def log_etl_step(
@@ -193,23 +319,38 @@ def log_etl_step(
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        # bound once per decorated function; rebound only after the context is updated
+        bound_kwargs = log_context.to_bind_kwargs()
+        step_logger = get_etl_logger(log_context)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            step_logger = get_etl_logger(
-                log_context
-            )
+            nonlocal bound_kwargs, step_logger
+            # to_bind_kwargs returns the same dict until a context field is assigned
+            if log_context.to_bind_kwargs() is not bound_kwargs:
+                bound_kwargs = log_context.to_bind_kwargs()
+                step_logger = get_etl_logger(log_context)
+
+            # no sink takes INFO: skip the timing and start/end records, keep the failure log
+            if _MIN_LEVEL_NO > _INFO_LEVEL_NO:
+                try:
+                    return func(*args, **kwargs)
+                except Exception:
+                    step_logger.exception("ETL step failed")
+                    raise
 
             start = time.perf_counter()
             step_logger.info("Starting ETL step")
             try:
                 result = func(*args, **kwargs)
                 duration = time.perf_counter() - start
-                step_logger.info(f"Completed ETL step in {duration:.2f}s")
+                # positional args: Loguru formats only if a sink accepts the record
+                step_logger.info("Completed ETL step in {:.2f}s", duration)
                 return result
             except Exception:
                 duration = time.perf_counter() - start
                 step_logger.exception(
-                    f"ETL step failed after {duration:.2f}s"
+                    "ETL step failed after {:.2f}s", duration
                 )
                 raise
 